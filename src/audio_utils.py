@@ -7,12 +7,32 @@ This module provides helper functions for:
 - Batch processing audio files
 """
 
+import fnmatch
+import hashlib
+import os
+import struct
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
 import soundfile as sf
 import sounddevice as sd
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Audio formats accepted by validate_audio_file
+AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.flac', '.ogg', '.m4a'})
+
+# Durations keyed by (path, st_mtime_ns, st_size) so edited files are re-read
+_DURATION_CACHE: Dict[Tuple[str, int, int], float] = {}
+
+# Content hashes keyed the same way as _DURATION_CACHE
+_HASH_CACHE: Dict[Tuple[str, int, int], str] = {}
+
 
 def validate_audio_file(audio_path: Path | str) -> bool:
     """
@@ -30,19 +50,110 @@ def validate_audio_file(audio_path: Path | str) -> bool:
         >>> validate_audio_file("nonexistent.wav")
         False
     """
-    audio_path = Path(audio_path)
+    audio_path = os.fspath(audio_path)
 
-    if not audio_path.exists():
+    # Check the extension first since it needs no filesystem access
+    if os.path.splitext(audio_path)[1].lower() not in AUDIO_EXTENSIONS:
         return False
 
-    if not audio_path.is_file():
-        return False
+    return os.path.isfile(audio_path)
 
-    # Check if it's a WAV file (or other supported format)
-    if audio_path.suffix.lower() not in ['.wav', '.mp3', '.flac', '.ogg', '.m4a']:
-        return False
 
-    return True
+def _read_wav_duration(audio_path: str) -> Optional[float]:
+    """
+    Read WAV duration from the RIFF header without decoding any audio.
+
+    Walks the RIFF chunks until both 'fmt ' and 'data' are found, so files
+    with extra chunks (LIST, fact, etc.) before the data are handled. The
+    data size is clamped to the bytes actually in the file, so truncated
+    recordings report what can be played back.
+
+    Args:
+        audio_path: Path to WAV file
+
+    Returns:
+        Duration in seconds, or None if the header can't be parsed or the
+        data size is a streaming placeholder (0 or 0xFFFFFFFF)
+    """
+    with open(audio_path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+
+        header = f.read(12)
+        if len(header) < 12:
+            return None
+        riff, _, wave = struct.unpack('<4sI4s', header)
+        if riff != b'RIFF' or wave != b'WAVE':
+            return None
+
+        sample_rate = block_align = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack('<4sI', header)
+
+            if chunk_id == b'fmt ':
+                fmt = f.read(chunk_size + (chunk_size & 1))
+                if len(fmt) < 14:
+                    return None
+                _, _, sample_rate, _, block_align = struct.unpack('<HHIIH', fmt[:14])
+            elif chunk_id == b'data':
+                # Writers that stream to disk leave a placeholder size until
+                # they finalize the header; let soundfile work it out
+                if not sample_rate or not block_align or chunk_size in (0, 0xFFFFFFFF):
+                    return None
+                data_size = min(chunk_size, file_size - f.tell())
+                return (data_size // block_align) / sample_rate
+            else:
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def get_audio_durations(audio_paths: List[Path | str]) -> List[Optional[float]]:
+    """
+    Get durations of several audio files in seconds.
+
+    WAV durations are read straight from the file header; other formats
+    are opened with soundfile and only the frame count is read. Results
+    are cached per (path, mtime, size), so repeated lookups of unchanged
+    files cost a single stat.
+
+    Args:
+        audio_paths: Paths to audio files
+
+    Returns:
+        Durations in seconds (None for files that cannot be read), in the
+        same order as audio_paths
+
+    Examples:
+        >>> get_audio_durations(["data/sample_audio/ni_hao.wav", "missing.wav"])
+        [3.0, None]
+    """
+    durations = []
+    for audio_path in audio_paths:
+        path = os.fspath(audio_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            durations.append(None)
+            continue
+
+        key = (path, st.st_mtime_ns, st.st_size)
+        duration = _DURATION_CACHE.get(key)
+        if duration is None:
+            try:
+                if path.lower().endswith('.wav'):
+                    duration = _read_wav_duration(path)
+                if duration is None:
+                    with sf.SoundFile(path) as snd:
+                        duration = snd.frames / snd.samplerate
+            except Exception:
+                durations.append(None)
+                continue
+            _DURATION_CACHE[key] = duration
+
+        durations.append(duration)
+
+    return durations
 
 
 def get_audio_duration(audio_path: Path | str) -> Optional[float]:
@@ -59,12 +170,69 @@ def get_audio_duration(audio_path: Path | str) -> Optional[float]:
         >>> get_audio_duration("data/sample_audio/ni_hao.wav")
         3.0
     """
+    return get_audio_durations([audio_path])[0]
+
+
+def hash_audio_file(
+    audio_path: Path | str,
+    st: Optional[os.stat_result] = None
+) -> str:
+    """
+    Compute a content hash of an audio file.
+
+    The hash identifies a recording by its bytes rather than its name, so
+    re-recorded or renamed files never collide in the transcription cache.
+    Digests are memoized per (path, mtime, size), so unchanged files are
+    only read once per process.
+
+    Args:
+        audio_path: Path to audio file
+        st: Optional os.stat() result for audio_path, to avoid a second stat
+
+    Returns:
+        Hex-encoded SHA-256 digest of the file contents
+
+    Examples:
+        >>> hash_audio_file("data/eval_audio/eval_ni_hao_perfect_001.wav")
+        '3b5d5c37...'
+    """
+    path = os.fspath(audio_path)
+    if st is None:
+        st = os.stat(path)
+
+    key = (path, st.st_mtime_ns, st.st_size)
+    digest = _HASH_CACHE.get(key)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+        _HASH_CACHE[key] = digest
+
+    return digest
+
+
+def prefetch_audio_file(audio_path: Path | str) -> None:
+    """
+    Ask the OS to pull an audio file into the page cache ahead of use.
+
+    Uses posix_fadvise(WILLNEED) where available, which starts readahead
+    without blocking; elsewhere the file is simply read once. Errors are
+    ignored since this is only a hint.
+
+    Args:
+        audio_path: Path to audio file
+
+    Examples:
+        >>> prefetch_audio_file("data/eval_audio/eval_ni_hao_perfect_001.wav")
+    """
     try:
-        audio_path = Path(audio_path)
-        info = sf.info(str(audio_path))
-        return info.duration
-    except Exception:
-        return None
+        with open(audio_path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while f.read(1 << 16):
+                    pass
+    except OSError:
+        pass
 
 
 def get_audio_files(directory: Path | str, pattern: str = "*.wav") -> List[Path]:
@@ -87,7 +255,29 @@ def get_audio_files(directory: Path | str, pattern: str = "*.wav") -> List[Path]
     if not directory.exists():
         return []
 
-    return sorted(directory.glob(pattern))
+    # Recursive or nested patterns need the full glob machinery
+    if '/' in pattern or os.sep in pattern:
+        return sorted(directory.glob(pattern))
+
+    # Plain suffix patterns like "*.wav" skip fnmatch entirely. Both sides go
+    # through normcase so matching stays case-insensitive on Windows, as
+    # Path.glob is there
+    suffix = None
+    if pattern.startswith('*') and not any(c in pattern[1:] for c in '*?['):
+        suffix = os.path.normcase(pattern[1:])
+
+    with os.scandir(directory) as entries:
+        paths = [
+            Path(entry.path)
+            for entry in entries
+            if (
+                os.path.normcase(entry.name).endswith(suffix) if suffix is not None
+                else fnmatch.fnmatch(entry.name, pattern)
+            ) and entry.is_file()
+        ]
+
+    paths.sort()
+    return paths
 
 
 def ensure_directory_exists(directory: Path | str) -> Path:
@@ -142,13 +332,13 @@ def construct_audio_path(base_dir: Path | str, filename: str, extension: str = "
         >>> construct_audio_path("data/eval_audio", "eval_ni_hao_perfect_001")
         PosixPath('data/eval_audio/eval_ni_hao_perfect_001.wav')
     """
-    base_dir = Path(base_dir)
-    filename = Path(filename).stem  # Remove extension if present
+    # Remove directory and extension if present
+    stem = os.path.splitext(os.path.basename(filename))[0]
 
     if not extension.startswith('.'):
         extension = '.' + extension
 
-    return base_dir / (filename + extension)
+    return Path(os.path.join(os.fspath(base_dir), stem + extension))
 
 
 def record_audio(
@@ -156,7 +346,8 @@ def record_audio(
     filename: Optional[str] = None,
     output_dir: Path | str = Path("data/eval_audio"),
     sample_rate: int = 16000,
-    channels: int = 1
+    channels: int = 1,
+    out: Optional[np.ndarray] = None
 ) -> tuple:
     """
     Record audio from microphone.
@@ -167,6 +358,10 @@ def record_audio(
         output_dir: Directory to save recordings (default: "data/eval_audio")
         sample_rate: Sample rate in Hz (default: 16000)
         channels: Number of channels (default: 1 for mono)
+        out: Optional preallocated float32 buffer of shape (frames, channels)
+            to record into instead of allocating a new array. The returned
+            audio_data is then a view into it and is overwritten by the next
+            recording that reuses the buffer.
 
     Returns:
         Tuple of (audio_data, sample_rate)
@@ -178,16 +373,25 @@ def record_audio(
         Recording complete!
         Saved to: data/eval_audio/test_recording.wav
     """
+    frames = int(duration * sample_rate)
+    if out is not None and len(out) < frames:
+        raise ValueError(
+            f"Buffer too small: {len(out)} frames for a {duration}s recording ({frames} frames)"
+        )
+
     print(f"Recording for {duration} seconds...")
     print("Start speaking now!")
 
     # Record audio
-    audio_data = sd.rec(
-        int(duration * sample_rate),
-        samplerate=sample_rate,
-        channels=channels,
-        dtype='float32'
-    )
+    if out is not None:
+        audio_data = sd.rec(out=out[:frames], samplerate=sample_rate)
+    else:
+        audio_data = sd.rec(
+            frames,
+            samplerate=sample_rate,
+            channels=channels,
+            dtype='float32'
+        )
     sd.wait()  # Wait until recording is finished
 
     print("Recording complete!")
@@ -227,18 +431,30 @@ def play_audio(
         >>> play_audio(["eval_ni_hao_perfect_001", "eval_xie_xie_perfect_001"],
         ...            base_dir="data/eval_audio")
     """
-    # Handle single path vs list of paths
+    # Handle single path vs list of paths, resolving each path once
     if isinstance(audio_path, (list, tuple)):
-        for path in audio_path:
-            play_audio(path, base_dir=base_dir, wait=wait)
-        return
+        paths = [_resolve_audio_path(path, base_dir) for path in audio_path]
+    else:
+        paths = [_resolve_audio_path(audio_path, base_dir)]
 
-    # Construct full path if needed
-    if base_dir is not None:
-        audio_path = construct_audio_path(base_dir, str(audio_path))
+    # Without waiting each sd.play() would cut off the previous clip, so
+    # only blocking multi-file playback goes through a shared stream
+    if len(paths) > 1 and wait:
+        _play_sequence(paths)
     else:
-        audio_path = Path(audio_path)
+        for path in paths:
+            _play_one(path, wait=wait)
+
+
+def _resolve_audio_path(audio_path: Path | str, base_dir: Optional[Path | str]) -> Path:
+    """Construct full path from a filename and base_dir if needed."""
+    if base_dir is not None:
+        return construct_audio_path(base_dir, str(audio_path))
+    return Path(audio_path)
+
 
+def _play_one(audio_path: Path, wait: bool = True) -> None:
+    """Play a single resolved audio file with sd.play()."""
     # Check if file exists
     if not audio_path.exists():
         print(f"Error: Audio file not found: {audio_path}")
@@ -258,6 +474,50 @@ def play_audio(
         print(f"Error playing audio: {e}")
 
 
+def _play_sequence(audio_paths: List[Path]) -> None:
+    """
+    Play resolved audio files back-to-back through one output stream.
+
+    The stream is only reopened when the sample rate or channel count
+    changes, so consecutive clips play without re-initializing the device.
+    """
+    stream = None
+    try:
+        for audio_path in audio_paths:
+            if not audio_path.exists():
+                print(f"Error: Audio file not found: {audio_path}")
+                continue
+
+            try:
+                audio_data, sample_rate = sf.read(
+                    str(audio_path), dtype='float32', always_2d=True
+                )
+                channels = audio_data.shape[1]
+
+                if (stream is None or stream.samplerate != sample_rate
+                        or stream.channels != channels):
+                    if stream is not None:
+                        stream.stop()
+                        stream.close()
+                    stream = sd.OutputStream(
+                        samplerate=sample_rate,
+                        channels=channels,
+                        dtype='float32'
+                    )
+                    stream.start()
+
+                print(f"Playing: {audio_path.name}")
+                stream.write(audio_data)  # Blocks until queued for playback
+                print(f"Finished playing: {audio_path.name}")
+
+            except Exception as e:
+                print(f"Error playing audio: {e}")
+    finally:
+        if stream is not None:
+            stream.stop()  # Lets the final buffers drain before closing
+            stream.close()
+
+
 def record_phrase_batch(
     yaml_path: Path | str,
     output_dir: Path | str = Path("data/eval_audio"),
@@ -285,10 +545,17 @@ def record_phrase_batch(
     # Load test cases from YAML
     yaml_path = Path(yaml_path)
     with open(yaml_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     test_cases = data['test_cases']
 
+    # One buffer sized for the longest phrase is reused for every recording
+    max_duration = max(
+        (case.get('duration', default_duration) for case in test_cases),
+        default=default_duration
+    )
+    buffer = np.empty((int(max_duration * sample_rate), 1), dtype='float32')
+
     print(f"Recording session starting!")
     print(f"Total phrases to record: {len(test_cases)}\n")
     input("Press Enter to begin...")
@@ -322,7 +589,8 @@ def record_phrase_batch(
             duration=duration,
             filename=filename,
             output_dir=output_dir,
-            sample_rate=sample_rate
+            sample_rate=sample_rate,
+            out=buffer
         )
         print("✓ Recorded\n")
 
@@ -0,0 +1,124 @@
+"""
+Concurrency helpers for the pronunciation assessment system.
+
+This module provides:
+- An adaptive limiter that tunes how many API requests run at once
+  based on observed latency and rate-limit errors
+"""
+
+import statistics
+import threading
+import time
+from typing import Callable, Optional, Tuple, Type
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe limiter whose concurrency adapts to observed latency.
+
+    Starts at `initial` concurrent calls. Each time `limit` calls have
+    completed, the median latency of that window is compared against the
+    best median seen so far:
+    - within `latency_tolerance` of it: the limit grows by one
+    - slower than that: the limit shrinks by one
+    A rate-limit error halves the limit immediately.
+
+    Attributes:
+        limit: Current number of calls allowed to run at once
+        minimum: Lower bound for limit
+        maximum: Upper bound for limit
+
+    Examples:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=16)
+        >>> limiter.call(transcribe_whisper, "data/eval_audio/eval_ni_hao_perfect_001.wav")
+        {'text': '你好', ...}
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        maximum: int = 8,
+        minimum: int = 1,
+        latency_tolerance: float = 0.2,
+        rate_limit_errors: Tuple[Type[BaseException], ...] = ()
+    ):
+        """
+        Args:
+            initial: Starting concurrency (clamped to [minimum, maximum])
+            maximum: Upper bound on concurrency
+            minimum: Lower bound on concurrency
+            latency_tolerance: Fractional latency increase over the best
+                observed median that still counts as stable (default: 0.2)
+            rate_limit_errors: Exception types that signal rate limiting
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.latency_tolerance = latency_tolerance
+        self.rate_limit_errors = rate_limit_errors
+
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._latencies = []
+        self._best_median = None
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) once a slot is free and record its latency.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+
+        Raises:
+            Any exception raised by func
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+        start = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except self.rate_limit_errors:
+            self._release(rate_limited=True)
+            raise
+        except BaseException:
+            self._release()
+            raise
+
+        self._release(latency=time.monotonic() - start)
+        return result
+
+    def _release(self, latency: Optional[float] = None, rate_limited: bool = False):
+        """Free a slot and adjust the limit from the latest observations."""
+        with self._condition:
+            self._in_flight -= 1
+
+            if rate_limited:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._latencies.clear()
+            elif latency is not None:
+                self._latencies.append(latency)
+                if len(self._latencies) >= self.limit:
+                    self._adjust()
+
+            self._condition.notify_all()
+
+    def _adjust(self):
+        """Grow or shrink the limit based on the last window of latencies."""
+        median = statistics.median(self._latencies)
+        self._latencies.clear()
+
+        if self._best_median is None or median < self._best_median:
+            self._best_median = median
+
+        if median > self._best_median * (1 + self.latency_tolerance):
+            self.limit = max(self.minimum, self.limit - 1)
+        else:
+            self.limit = min(self.maximum, self.limit + 1)
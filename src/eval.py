@@ -20,15 +20,31 @@ Usage:
 
     # Skip API calls (use cached transcriptions if available)
     uv run python src/eval.py --use-cache
+
+    # Limit the number of concurrent Whisper API requests
+    uv run python src/eval.py --concurrency 4
 """
 
 import argparse
 import json
+import os
+import stat
+import sys
 import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, fields
 from pathlib import Path
 from typing import Dict, List, Optional
 import yaml
 from dotenv import load_dotenv
+from openai import RateLimitError
+from tqdm import tqdm
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 from .transcription import (
     transcribe_whisper,
@@ -38,10 +54,12 @@ from .transcription import (
     calculate_api_cost,
     get_openai_client
 )
+from .concurrency import AdaptiveConcurrencyLimiter
 from .scoring import assess_pronunciation
 from .audio_utils import (
-    validate_audio_file,
     construct_audio_path,
+    hash_audio_file,
+    prefetch_audio_file,
     ensure_directory_exists
 )
 from .report import (
@@ -55,11 +73,70 @@ from .report import (
 # Default paths
 DEFAULT_METADATA_FILE = Path("data/eval_metadata.yml")
 DEFAULT_AUDIO_DIR = Path("data/eval_audio")
-DEFAULT_CACHE_FILE = Path("data/eval_transcriptions_cache.json")
+DEFAULT_CACHE_FILE = Path("data/eval_transcriptions_cache.jsonl")
 DEFAULT_OUTPUT_DIR = Path("results")
+DEFAULT_CONCURRENCY = 8
+INITIAL_CONCURRENCY = 4
+PREFETCH_WORKERS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class EvalCase:
+    """
+    A single evaluation test case from eval_metadata.yml.
+
+    Attributes:
+        filename: Audio filename without extension
+        expected_chinese: What should have been said (Chinese characters)
+        expected_pinyin: Expected pinyin with numeric tones (e.g., 'ni3 hao3')
+        error_type: Type of error recorded (e.g., 'correct', 'wrong_tone')
+        severity: Error severity (slight, moderate, severe) or None
+        pronunciation_target: What the speaker actually aimed to say
+        target_error: Description of the intentional error
+        notes: Free-form notes
+        duration: Recording duration in seconds
+    """
+    filename: str
+    expected_chinese: str
+    expected_pinyin: str
+    error_type: str
+    severity: Optional[str] = None
+    pronunciation_target: Optional[str] = None
+    target_error: Optional[str] = None
+    notes: Optional[str] = None
+    duration: int = 3
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EvalCase':
+        """
+        Build a test case from a metadata dictionary.
+
+        Unknown keys are ignored so metadata can carry extra annotations.
 
+        Args:
+            data: Test case dictionary as loaded from YAML
 
-def load_eval_metadata(metadata_file: Path) -> List[Dict]:
+        Returns:
+            EvalCase instance
+
+        Raises:
+            ValueError: If a required field is missing
+        """
+        case_fields = fields(cls)
+        missing = [
+            f.name for f in case_fields
+            if f.default is MISSING and f.name not in data
+        ]
+        if missing:
+            raise ValueError(
+                f"Test case {data.get('filename', '<unnamed>')} is missing "
+                f"required fields: {', '.join(missing)}"
+            )
+
+        return cls(**{f.name: data[f.name] for f in case_fields if f.name in data})
+
+
+def load_eval_metadata(metadata_file: Path) -> List[EvalCase]:
     """
     Load evaluation metadata from YAML file.
 
@@ -67,73 +144,190 @@ def load_eval_metadata(metadata_file: Path) -> List[Dict]:
         metadata_file: Path to eval_metadata.yml
 
     Returns:
-        List of test case dictionaries
+        List of validated test cases
+
+    Raises:
+        FileNotFoundError: If metadata_file does not exist
+        ValueError: If a test case is missing required fields
     """
     if not metadata_file.exists():
         raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
 
     with open(metadata_file, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    return [EvalCase.from_dict(tc) for tc in data['test_cases']]
+
 
-    return data['test_cases']
+# Shared compact encoder for cache lines. Without indent, json uses its C
+# encoder, and reusing one instance avoids rebuilding it for every entry.
+_CACHE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _encode_cache_entry(key: str, value: Dict) -> str:
+    """Serialize one cache entry as a JSON Lines record."""
+    return _CACHE_ENCODER.encode({key: value}) + '\n'
 
 
 def load_cache(cache_file: Path) -> Dict:
     """
-    Load cached transcriptions from JSON file.
+    Load cached transcriptions from a JSON Lines file.
+
+    Each line holds one {content_hash: transcription_result} entry; later
+    lines override earlier ones for the same hash. Lines that fail to parse
+    (e.g. a write cut short by a crash) or don't hold a JSON object are
+    skipped. When more than half of the lines are superseded the file is
+    compacted in place.
+
+    A cache written as a single JSON object (the format used before JSON
+    Lines) is read as-is and rewritten one entry per line. A file with no
+    readable entries is moved aside rather than overwritten.
 
     Args:
         cache_file: Path to cache file
 
     Returns:
-        Dictionary mapping filename to transcription result
+        Dictionary mapping audio content hash to transcription result
     """
     if not cache_file.exists():
         return {}
 
-    with open(cache_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    text = cache_file.read_text(encoding='utf-8')
+
+    try:
+        legacy = json.loads(text)
+    except json.JSONDecodeError:
+        legacy = None
+    if isinstance(legacy, dict):
+        # A pretty-printed object can't take appended lines, so convert it
+        # once; a single-line object is already a valid one-line cache
+        if '\n' in text.rstrip('\n'):
+            save_cache(legacy, cache_file)
+        return legacy
+
+    cache = {}
+    lines = text.splitlines()
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        # Valid JSON that isn't an object (e.g. a hand-edited line) is
+        # just as unusable as a truncated one
+        if isinstance(entry, dict):
+            cache.update(entry)
+
+    if not cache:
+        if text.strip():
+            unreadable = cache_file.with_name(f"{cache_file.name}.{int(time.time())}.unreadable")
+            cache_file.replace(unreadable)
+            print(f"Warning: no readable entries in {cache_file}; moved it to {unreadable}")
+        return {}
+
+    if len(lines) > 2 * len(cache):
+        save_cache(cache, cache_file)
+
+    return cache
 
 
 def save_cache(cache: Dict, cache_file: Path):
     """
-    Save transcriptions to cache file.
+    Rewrite the cache file with exactly the given entries.
+
+    Args:
+        cache: Dictionary mapping audio content hash to transcription result
+        cache_file: Path to cache file
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first so a crash never truncates the cache
+    tmp_file = cache_file.with_suffix(cache_file.suffix + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(_encode_cache_entry(k, v) for k, v in cache.items()))
+    tmp_file.replace(cache_file)
+
+
+def append_cache_entries(entries: Dict, cache_file: Path):
+    """
+    Append new transcriptions to the cache file.
+
+    Only the new entries are serialized, so saving is independent of the
+    size of the existing cache. If the file ends mid-line (e.g. a write cut
+    short by a crash), a newline is written first so the new entries don't
+    run into the broken one.
 
     Args:
-        cache: Dictionary mapping filename to transcription result
+        entries: Dictionary mapping audio content hash to transcription result
         cache_file: Path to cache file
     """
     cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+    # Append mode sends every write to the end regardless of where the
+    # last-byte check leaves the position
+    with open(cache_file, 'a+b') as f:
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+        f.write(''.join(_encode_cache_entry(k, v) for k, v in entries.items()).encode('utf-8'))
+
+
+def _persist_case_cache(case_cache: ChainMap, cache: Dict, cache_file: Path) -> int:
+    """
+    Move a test case's new transcriptions into the shared cache and cache file.
+
+    The case's overlay is emptied afterwards, so persisting it again is a no-op.
+
+    Args:
+        case_cache: ChainMap whose first map holds the case's new transcriptions
+        cache: Shared cache dictionary
+        cache_file: Path to cache file
+
+    Returns:
+        Number of transcriptions persisted
+    """
+    new_entries = case_cache.maps[0]
+    count = len(new_entries)
+    if count:
+        append_cache_entries(new_entries, cache_file)
+        cache.update(new_entries)
+        new_entries.clear()
+    return count
 
 
 def run_single_evaluation(
-    test_case: Dict,
+    test_case: EvalCase,
     audio_dir: Path,
     client,
     use_cache: bool = False,
-    cache: Optional[Dict] = None
+    cache: Optional[Dict] = None,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
 ) -> Dict:
     """
     Run evaluation on a single test case.
 
     Args:
-        test_case: Test case metadata dictionary
+        test_case: Test case metadata
         audio_dir: Directory containing audio files
         client: OpenAI client instance
         use_cache: Whether to use cached transcriptions
-        cache: Cache dictionary (if use_cache is True)
+        cache: Cache dictionary keyed by audio content hash
+        limiter: Optional limiter gating concurrent API calls
 
     Returns:
         Evaluation result dictionary
     """
-    filename = test_case['filename']
+    filename = test_case.filename
     audio_path = construct_audio_path(audio_dir, filename)
 
-    # Validate audio file exists
-    if not validate_audio_file(audio_path):
+    # Validate audio file exists. A single stat is enough since the path is
+    # always built with a .wav extension, and its result is reused below.
+    try:
+        audio_stat = os.stat(audio_path)
+    except OSError:
+        audio_stat = None
+
+    if audio_stat is None or not stat.S_ISREG(audio_stat.st_mode):
         return {
             'filename': filename,
             'error': f'Audio file not found or invalid: {audio_path}',
@@ -143,18 +337,33 @@ def run_single_evaluation(
 
     # Get transcription (from cache or API)
     start_time = time.time()
+    try:
+        cache_key = hash_audio_file(audio_path, st=audio_stat)
+    except OSError as e:
+        # Unreadable audio fails this case only, like a failed API call
+        return {
+            'filename': filename,
+            'error': f'Transcription failed: {str(e)}',
+            'score': 0.0,
+            'overall_match': False
+        }
 
-    if use_cache and cache and filename in cache:
-        transcription_result = cache[filename]
+    if use_cache and cache and cache_key in cache:
+        transcription_result = cache[cache_key]
         used_cache = True
     else:
         try:
-            transcription_result = transcribe_whisper(audio_path, client=client)
+            if limiter is not None:
+                transcription_result = limiter.call(
+                    transcribe_whisper, audio_path, client=client
+                )
+            else:
+                transcription_result = transcribe_whisper(audio_path, client=client)
             used_cache = False
 
             # Add to cache
             if cache is not None:
-                cache[filename] = transcription_result
+                cache[cache_key] = transcription_result
         except Exception as e:
             return {
                 'filename': filename,
@@ -175,30 +384,20 @@ def run_single_evaluation(
 
     # Run pronunciation assessment
     # Also normalize expected text to remove any punctuation
-    expected_chinese = test_case['expected_chinese']
+    expected_chinese = test_case.expected_chinese
     expected_chinese = remove_punctuation(expected_chinese)
 
-    if is_roman:
-        # Can't assess romanization properly
-        assessment_result = {
-            'overall_match': False,
-            'score': 0.0,
-            'expected_pinyin': test_case['expected_pinyin'],
-            'actual_pinyin': 'N/A (romanization)',
-            'syllable_details': [],
-            'summary': f'Whisper returned romanization: "{actual_chinese}" (cannot assess)'
-        }
-    else:
-        assessment_result = assess_pronunciation(expected_chinese, actual_chinese)
+    # Romanized transcriptions short-circuit to a zero score inside assess_pronunciation
+    assessment_result = assess_pronunciation(expected_chinese, actual_chinese)
 
     # Combine results
     result = {
         'filename': filename,
-        'error_type': test_case['error_type'],
-        'severity': test_case.get('severity'),
+        'error_type': test_case.error_type,
+        'severity': test_case.severity,
         'expected_chinese': expected_chinese,
         'actual_chinese': actual_chinese,
-        'expected_pinyin': test_case['expected_pinyin'],
+        'expected_pinyin': test_case.expected_pinyin,
         'actual_pinyin': assessment_result['actual_pinyin'],
         'score': assessment_result['score'],
         'overall_match': assessment_result['overall_match'],
@@ -218,11 +417,17 @@ def run_evaluation(
     error_type: Optional[str] = None,
     output_dir: Optional[Path] = None,
     use_cache: bool = False,
-    cache_file: Path = DEFAULT_CACHE_FILE
+    cache_file: Path = DEFAULT_CACHE_FILE,
+    concurrency: int = DEFAULT_CONCURRENCY
 ) -> List[Dict]:
     """
     Run full evaluation on all test cases.
 
+    Test cases are evaluated on a thread pool so that Whisper API calls
+    overlap; results are still reported and returned in metadata order.
+    The number of simultaneous API calls starts low and adapts to observed
+    latency and rate limiting, never exceeding `concurrency`.
+
     Args:
         metadata_file: Path to eval_metadata.yml
         audio_dir: Directory containing audio files
@@ -230,6 +435,7 @@ def run_evaluation(
         output_dir: Optional directory to save results
         use_cache: Whether to use cached transcriptions
         cache_file: Path to cache file
+        concurrency: Maximum number of concurrent transcription requests
 
     Returns:
         List of evaluation result dictionaries
@@ -243,7 +449,7 @@ def run_evaluation(
 
     # Filter by error type if specified
     if error_type:
-        test_cases = [tc for tc in test_cases if tc['error_type'] == error_type]
+        test_cases = [tc for tc in test_cases if tc.error_type == error_type]
         print(f"Filtered to {len(test_cases)} test cases with error_type='{error_type}'")
 
     if not test_cases:
@@ -261,30 +467,87 @@ def run_evaluation(
 
     # Initialize OpenAI client
     client = get_openai_client()
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=INITIAL_CONCURRENCY,
+        maximum=concurrency,
+        rate_limit_errors=(RateLimitError,)
+    )
 
     # Run evaluations
     results = []
     total_duration = 0
+    new_entry_count = 0
 
-    for i, test_case in enumerate(test_cases, 1):
-        filename = test_case['filename']
-        print_progress(i, len(test_cases), filename)
+    with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as prefetcher, \
+            ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        # Each worker writes new transcriptions into its own overlay so the
+        # shared cache is only ever modified from this thread
+        case_caches = [ChainMap({}, cache) for _ in test_cases]
+        futures = []
 
-        result = run_single_evaluation(
-            test_case,
-            audio_dir,
-            client,
-            use_cache=use_cache,
-            cache=cache
-        )
-
-        results.append(result)
-        total_duration += result.get('duration', 0)
-
-    # Save cache if we added new entries
-    if not use_cache or len(cache) > 0:
-        save_cache(cache, cache_file)
-        print(f"\nSaved transcription cache to: {cache_file}")
+        try:
+            # Warm the page cache for queued audio while earlier requests are
+            # still waiting on the API
+            for test_case in test_cases:
+                prefetcher.submit(
+                    prefetch_audio_file,
+                    construct_audio_path(audio_dir, test_case.filename)
+                )
+
+            for test_case, case_cache in zip(test_cases, case_caches):
+                futures.append(executor.submit(
+                    run_single_evaluation,
+                    test_case,
+                    audio_dir,
+                    client,
+                    use_cache=use_cache,
+                    cache=case_cache,
+                    limiter=limiter
+                ))
+
+            # Interactive runs get a single coalesced progress bar; logs and
+            # notebooks keep one line per test case. The bar goes to stdout
+            # (tqdm defaults to stderr) so both forms follow the same stream.
+            show_bar = sys.stdout.isatty()
+
+            with tqdm(
+                total=len(test_cases),
+                desc='eval',
+                unit='case',
+                mininterval=0.2,
+                file=sys.stdout,
+                disable=not show_bar
+            ) as progress:
+                for i, (test_case, case_cache, future) in enumerate(
+                    zip(test_cases, case_caches, futures), 1
+                ):
+                    result = future.result()
+                    total_duration += result.get('duration', 0)
+
+                    if show_bar:
+                        cost = calculate_api_cost(total_duration)
+                        progress.set_postfix(cost=f'${cost:.4f}', refresh=False)
+                        progress.update()
+                    else:
+                        print_progress(i, len(test_cases), test_case.filename)
+
+                    # Persist new transcriptions as they arrive so an
+                    # interrupted run keeps everything transcribed so far
+                    new_entry_count += _persist_case_cache(case_cache, cache, cache_file)
+
+                    results.append(result)
+        except BaseException:
+            # Stop queued (billed) transcriptions from starting, wait for the
+            # in-flight ones, and keep every transcription already paid for
+            prefetcher.shutdown(cancel_futures=True)
+            executor.shutdown(cancel_futures=True)
+            for case_cache, future in zip(case_caches, futures):
+                if future.done() and not future.cancelled():
+                    _persist_case_cache(case_cache, cache, cache_file)
+            raise
+
+    if new_entry_count > 0:
+        print(f"\nAdded {new_entry_count} transcriptions to cache: {cache_file}")
 
     # Calculate costs
     total_cost = calculate_api_cost(total_duration)
@@ -324,6 +587,9 @@ Examples:
 
   # Skip API calls (use cached transcriptions)
   uv run python src/eval.py --use-cache
+
+  # Limit concurrent Whisper API requests
+  uv run python src/eval.py --concurrency 4
         """
     )
 
@@ -366,6 +632,13 @@ Examples:
         help=f'Path to cache file (default: {DEFAULT_CACHE_FILE})'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Maximum concurrent transcription requests (default: {DEFAULT_CONCURRENCY})'
+    )
+
     args = parser.parse_args()
 
     # Run evaluation
@@ -375,7 +648,8 @@ Examples:
         error_type=args.error_type,
         output_dir=args.output,
         use_cache=args.use_cache,
-        cache_file=args.cache_file
+        cache_file=args.cache_file,
+        concurrency=args.concurrency
     )
 
 
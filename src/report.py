@@ -7,12 +7,92 @@ This module provides functions to generate:
 - Failure analysis and recommendations
 """
 
-from collections import defaultdict
+import csv
+import itertools
+import sys
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import pandas as pd
+import numpy as np
+
+
+# Horizontal rule framing the console report
+REPORT_RULE = "=" * 80
+
+# Column order for CSV output (only columns present in the results are written)
+CSV_COLUMNS = [
+    'filename',
+    'error_type',
+    'severity',
+    'score',
+    'overall_match',
+    'expected_chinese',
+    'actual_chinese',
+    'expected_pinyin',
+    'actual_pinyin',
+    'summary',
+    'is_romanization',
+    'processing_time'
+]
+
+# Sequence numbers for create_timestamped_filename(unique=True)
+_FILENAME_SEQUENCE = itertools.count()
+
+# Write buffer for CSV output, so large result sets flush in a few big writes
+CSV_WRITE_BUFFER = 1 << 20
+
+
+def _format_ratio(count: int, total: int) -> str:
+    """Format a count as 'count/total (pct%)' for the console report."""
+    return f"{count}/{total} ({count / total * 100:.1f}%)"
+
+
+def _detection_rate(bucket: Dict) -> float:
+    """Percentage of an error type's cases that were not scored as perfect."""
+    return (bucket['count'] - bucket['perfect']) / bucket['count'] * 100
+
+
+def _group_by_error_type(results: List[Dict]) -> Dict[str, Dict]:
+    """
+    Aggregate results by error type.
+
+    Group indices come from np.unique and the per-group reductions from
+    np.bincount, so each aggregate is a single C-level pass. Results without
+    an error_type (cases that failed before assessment) are left out,
+    matching how pandas groupby drops missing keys.
+
+    Args:
+        results: List of evaluation result dictionaries
+
+    Returns:
+        Dictionary mapping each error type, in sorted order, to its
+        'count', 'score_sum' and 'perfect' (number of overall matches)
+    """
+    typed = [r for r in results if r.get('error_type') is not None]
+    if not typed:
+        return {}
+
+    error_types, inverse = np.unique(
+        np.array([r['error_type'] for r in typed]), return_inverse=True
+    )
+    scores = np.fromiter((r['score'] for r in typed), dtype=np.float64, count=len(typed))
+    matches = np.fromiter((bool(r['overall_match']) for r in typed), dtype=np.int64, count=len(typed))
+
+    counts = np.bincount(inverse)
+    score_sums = np.bincount(inverse, weights=scores)
+    perfect_counts = np.bincount(inverse, weights=matches)
+
+    return {
+        str(error_type): {
+            'count': int(count),
+            'score_sum': float(score_sum),
+            'perfect': int(perfect)
+        }
+        for error_type, count, score_sum, perfect
+        in zip(error_types, counts, score_sums, perfect_counts)
+    }
 
 
 def generate_console_report(results: List[Dict], total_duration: float, total_cost: float) -> str:
@@ -43,13 +123,27 @@ def generate_console_report(results: List[Dict], total_duration: float, total_co
             'processing_time': 0.5
         }
     """
-    df = pd.DataFrame(results)
     total_cases = len(results)
+    scores = np.fromiter((r['score'] for r in results), dtype=np.float64, count=total_cases)
+    matches = np.fromiter((r['overall_match'] for r in results), dtype=np.bool_, count=total_cases)
+
+    # Classify missed errors, false positives and romanization fallbacks in one pass
+    failures = []
+    flagged_correct = []
+    romanization_count = 0
+    for r in results:
+        if r.get('is_romanization'):
+            romanization_count += 1
+        if r.get('error_type') == 'correct':
+            if not r['overall_match']:
+                flagged_correct.append(r)
+        elif r['overall_match']:
+            failures.append(r)
 
     report = []
-    report.append("=" * 80)
+    report.append(REPORT_RULE)
     report.append("EVALUATION RESULTS")
-    report.append("=" * 80)
+    report.append(REPORT_RULE)
     report.append("")
 
     # Overall metrics
@@ -62,44 +156,43 @@ def generate_console_report(results: List[Dict], total_duration: float, total_co
 
     # Overall accuracy
     report.append("--- Overall Performance ---")
-    report.append(f"Average Score: {df['score'].mean():.1f}%")
-    report.append(f"Median Score: {df['score'].median():.1f}%")
-    report.append(f"Score Range: {df['score'].min():.1f}% - {df['score'].max():.1f}%")
-    perfect_count = df['overall_match'].sum()
-    report.append(f"Perfect Pronunciations: {perfect_count}/{total_cases} ({perfect_count/total_cases*100:.1f}%)")
+    report.append(f"Average Score: {scores.mean():.1f}%")
+    report.append(f"Median Score: {np.median(scores):.1f}%")
+    report.append(f"Score Range: {scores.min():.1f}% - {scores.max():.1f}%")
+    perfect_count = int(np.count_nonzero(matches))
+    report.append(f"Perfect Pronunciations: {_format_ratio(perfect_count, total_cases)}")
     report.append("")
 
     # By error type
     report.append("--- Performance by Error Type ---")
-    error_types = df.groupby('error_type')
+    error_type_buckets = _group_by_error_type(results)
 
-    for error_type, group in error_types:
-        n = len(group)
-        avg_score = group['score'].mean()
-        perfect = group['overall_match'].sum()
+    for error_type, bucket in error_type_buckets.items():
+        n = bucket['count']
+        avg_score = bucket['score_sum'] / n
+        perfect = bucket['perfect']
 
         report.append(f"\n{error_type} (n={n}):")
         report.append(f"  Average Score: {avg_score:.1f}%")
-        report.append(f"  Perfect: {perfect}/{n} ({perfect/n*100:.1f}%)")
+        report.append(f"  Perfect: {_format_ratio(perfect, n)}")
 
         if error_type == 'correct':
             # For correct pronunciation, report false positives
             false_positives = n - perfect
             if false_positives > 0:
-                report.append(f"  ⚠ False Positives: {false_positives}/{n} ({false_positives/n*100:.1f}%)")
+                report.append(f"  ⚠ False Positives: {_format_ratio(false_positives, n)}")
                 report.append(f"    (System incorrectly flagged correct pronunciation as wrong)")
         else:
             # For error types, report detection rate
             detected = n - perfect
-            report.append(f"  Detection Rate: {detected}/{n} ({detected/n*100:.1f}%)")
+            report.append(f"  Detection Rate: {_format_ratio(detected, n)}")
             if perfect > 0:
-                report.append(f"  ⚠ Missed Errors: {perfect}/{n} ({perfect/n*100:.1f}%)")
+                report.append(f"  ⚠ Missed Errors: {_format_ratio(perfect, n)}")
 
     # Romanization fallbacks
     report.append("")
     report.append("--- Romanization Analysis ---")
-    romanization_count = df['is_romanization'].sum() if 'is_romanization' in df else 0
-    report.append(f"Romanization Fallbacks: {romanization_count}/{total_cases} ({romanization_count/total_cases*100:.1f}%)")
+    report.append(f"Romanization Fallbacks: {_format_ratio(romanization_count, total_cases)}")
     if romanization_count > 0:
         report.append(f"  (Cases where Whisper couldn't transcribe to Chinese)")
 
@@ -108,11 +201,10 @@ def generate_console_report(results: List[Dict], total_duration: float, total_co
     report.append("--- Failure Analysis ---")
     report.append("")
 
-    # Find cases where system failed to detect errors
-    failures = df[(df['error_type'] != 'correct') & (df['overall_match'] == True)]
+    # Cases where system failed to detect errors
     if len(failures) > 0:
         report.append(f"Cases where system MISSED errors ({len(failures)} total):")
-        for _, row in failures.iterrows():
+        for row in failures:
             report.append(f"  • {row['filename']}")
             report.append(f"    Expected error: {row['error_type']} ({row.get('severity', 'unknown')})")
             report.append(f"    Score: {row['score']}% (should be lower)")
@@ -122,11 +214,10 @@ def generate_console_report(results: List[Dict], total_duration: float, total_co
         report.append("✓ No missed errors - system detected all intentional mistakes!")
         report.append("")
 
-    # Find cases where system incorrectly flagged correct pronunciation
-    false_positives = df[(df['error_type'] == 'correct') & (df['overall_match'] == False)]
-    if len(false_positives) > 0:
-        report.append(f"Cases where system INCORRECTLY flagged errors ({len(false_positives)} total):")
-        for _, row in false_positives.iterrows():
+    # Cases where system incorrectly flagged correct pronunciation
+    if len(flagged_correct) > 0:
+        report.append(f"Cases where system INCORRECTLY flagged errors ({len(flagged_correct)} total):")
+        for row in flagged_correct:
             report.append(f"  • {row['filename']}")
             report.append(f"    Expected: Perfect (100%)")
             report.append(f"    Got: {row['score']}%")
@@ -140,24 +231,24 @@ def generate_console_report(results: List[Dict], total_duration: float, total_co
     report.append("--- Recommendations ---")
     report.append("")
 
-    # Calculate error type specific accuracy
-    tone_errors = df[df['error_type'] == 'wrong_tone']
-    if len(tone_errors) > 0:
-        tone_detection = (len(tone_errors) - tone_errors['overall_match'].sum()) / len(tone_errors) * 100
+    # Calculate error type specific accuracy from the error type buckets
+    tone_errors = error_type_buckets.get('wrong_tone')
+    if tone_errors:
+        tone_detection = _detection_rate(tone_errors)
         report.append(f"• Tone error detection: {tone_detection:.1f}%")
         if tone_detection < 80:
             report.append(f"  ⚠ Needs improvement - consider additional tone-specific tests")
 
-    initial_errors = df[df['error_type'] == 'wrong_initial']
-    if len(initial_errors) > 0:
-        initial_detection = (len(initial_errors) - initial_errors['overall_match'].sum()) / len(initial_errors) * 100
+    initial_errors = error_type_buckets.get('wrong_initial')
+    if initial_errors:
+        initial_detection = _detection_rate(initial_errors)
         report.append(f"• Initial consonant error detection: {initial_detection:.1f}%")
         if initial_detection < 80:
             report.append(f"  ⚠ Needs improvement")
 
-    final_errors = df[df['error_type'] == 'wrong_final']
-    if len(final_errors) > 0:
-        final_detection = (len(final_errors) - final_errors['overall_match'].sum()) / len(final_errors) * 100
+    final_errors = error_type_buckets.get('wrong_final')
+    if final_errors:
+        final_detection = _detection_rate(final_errors)
         report.append(f"• Final/vowel error detection: {final_detection:.1f}%")
         if final_detection < 80:
             report.append(f"  ⚠ Needs improvement")
@@ -167,7 +258,7 @@ def generate_console_report(results: List[Dict], total_duration: float, total_co
         report.append(f"  → Consider implementing fuzzy matching for romanized output")
 
     report.append("")
-    report.append("=" * 80)
+    report.append(REPORT_RULE)
 
     return "\n".join(report)
 
@@ -183,30 +274,22 @@ def save_results_csv(results: List[Dict], output_path: Path | str) -> Path:
     Returns:
         Path to saved CSV file
     """
-    df = pd.DataFrame(results)
-
-    # Reorder columns for better readability
-    column_order = [
-        'filename',
-        'error_type',
-        'severity',
-        'score',
-        'overall_match',
-        'expected_chinese',
-        'actual_chinese',
-        'expected_pinyin',
-        'actual_pinyin',
-        'summary',
-        'is_romanization',
-        'processing_time'
-    ]
-
-    # Only include columns that exist
-    columns = [col for col in column_order if col in df.columns]
-    df = df[columns]
+    # Reorder columns for better readability, only including columns that exist
+    present = set().union(*results)
+    columns = [col for col in CSV_COLUMNS if col in present]
+
+    # Rows are pulled out with one itemgetter when every result has every
+    # column; failed cases lack most fields, so fall back to .get() for those
+    if len(columns) > 1 and present.intersection(*results).issuperset(columns):
+        rows = map(itemgetter(*columns), results)
+    else:
+        rows = ([r.get(col, '') for col in columns] for r in results)
 
     output_path = Path(output_path)
-    df.to_csv(output_path, index=False, encoding='utf-8')
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(columns)
+        writer.writerows(rows)
 
     return output_path
 
@@ -221,26 +304,29 @@ def generate_summary_stats(results: List[Dict]) -> Dict:
     Returns:
         Dictionary with summary statistics
     """
-    df = pd.DataFrame(results)
+    scores = np.fromiter((r['score'] for r in results), dtype=np.float64, count=len(results))
+    matches = np.fromiter((r['overall_match'] for r in results), dtype=np.bool_, count=len(results))
 
     stats = {
         'total_cases': len(results),
-        'average_score': df['score'].mean(),
-        'median_score': df['score'].median(),
-        'min_score': df['score'].min(),
-        'max_score': df['score'].max(),
-        'perfect_count': df['overall_match'].sum(),
-        'perfect_rate': df['overall_match'].mean(),
+        'average_score': scores.mean(),
+        'median_score': np.median(scores),
+        'min_score': scores.min(),
+        'max_score': scores.max(),
+        'perfect_count': int(np.count_nonzero(matches)),
+        'perfect_rate': matches.mean(),
     }
 
     # By error type
     stats['by_error_type'] = {}
-    for error_type, group in df.groupby('error_type'):
+    for error_type, bucket in _group_by_error_type(results).items():
+        n = bucket['count']
+        flagged_rate = (n - bucket['perfect']) / n
         stats['by_error_type'][error_type] = {
-            'count': len(group),
-            'average_score': group['score'].mean(),
-            'detection_rate': (len(group) - group['overall_match'].sum()) / len(group) if error_type != 'correct' else None,
-            'false_positive_rate': (len(group) - group['overall_match'].sum()) / len(group) if error_type == 'correct' else None
+            'count': n,
+            'average_score': bucket['score_sum'] / n,
+            'detection_rate': flagged_rate if error_type != 'correct' else None,
+            'false_positive_rate': flagged_rate if error_type == 'correct' else None
         }
 
     return stats
@@ -256,17 +342,20 @@ def print_progress(current: int, total: int, filename: str, status: str = "Proce
         filename: Current filename being processed
         status: Status message (default: "Processing")
     """
-    progress = current / total * 100
-    print(f"[{current}/{total}] ({progress:.1f}%) {status}: {filename}")
+    progress = current / (total or 1) * 100
+    # One write per line; print() issues separate writes for the text and newline
+    sys.stdout.write(f"[{current}/{total}] ({progress:.1f}%) {status}: {filename}\n")
 
 
-def create_timestamped_filename(base_name: str, extension: str = ".csv") -> str:
+def create_timestamped_filename(base_name: str, extension: str = ".csv", unique: bool = False) -> str:
     """
     Create filename with timestamp.
 
     Args:
         base_name: Base filename without extension
         extension: File extension (default: ".csv")
+        unique: Append a per-process sequence number so that names created
+            within the same second don't collide (default: False)
 
     Returns:
         Filename with timestamp
@@ -274,9 +363,13 @@ def create_timestamped_filename(base_name: str, extension: str = ".csv") -> str:
     Examples:
         >>> create_timestamped_filename("eval_results")
         'eval_results_20250122_143052.csv'
+        >>> create_timestamped_filename("eval_results", unique=True)
+        'eval_results_20250122_143052_0000.csv'
     """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if not extension.startswith('.'):
         extension = '.' + extension
 
+    if unique:
+        return f"{base_name}_{timestamp}_{next(_FILENAME_SEQUENCE):04d}{extension}"
     return f"{base_name}_{timestamp}{extension}"
@@ -8,12 +8,13 @@ This module provides phoneme-level analysis of Mandarin pronunciation by:
 """
 
 from dataclasses import dataclass
-from typing import Dict, List
-from .transcription import text_to_pinyin
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from .transcription import text_to_pinyin, is_romanization
 from pypinyin import Style
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Syllable:
     """
     Represents a Mandarin syllable with phonetic components.
@@ -49,6 +50,11 @@ INITIALS = [
 # Sort by length (longest first) to check 'zh', 'ch', 'sh' before 'z', 'c', 's'
 INITIALS_SORTED = sorted(INITIALS, key=len, reverse=True)
 
+# Initials grouped by length: a syllable's initial is found by checking its
+# first two characters, then its first character, against these sets.
+_TWO_LETTER_INITIALS = frozenset(init for init in INITIALS if len(init) == 2)
+_ONE_LETTER_INITIALS = frozenset(init for init in INITIALS if len(init) == 1)
+
 # Tone names for human-readable feedback
 TONE_NAMES = {
     '1': 'first tone (flat)',
@@ -58,11 +64,22 @@ TONE_NAMES = {
     '5': 'neutral tone'
 }
 
+# Summary labels for (tone, initial, final) error counts, in report order
+FEEDBACK_ERROR_LABELS = (
+    'tone error(s)',
+    'initial consonant error(s)',
+    'vowel/final error(s)'
+)
+
 
+@lru_cache(maxsize=8192)
 def decompose_pinyin(pinyin_syllable: str) -> Syllable:
     """
     Break pinyin into initial, final, and tone components.
 
+    Results are memoized: Mandarin has only a few thousand toned syllables,
+    so repeated assessments reuse the same (immutable) Syllable objects.
+
     Args:
         pinyin_syllable: Pinyin with numeric tone (e.g., 'ni3', 'hao3', 'zhi1')
 
@@ -78,31 +95,38 @@ def decompose_pinyin(pinyin_syllable: str) -> Syllable:
         Syllable(full='zhi1', initial='zh', final='i', tone='1')
     """
     # Extract tone (last character if it's a digit)
-    if pinyin_syllable and pinyin_syllable[-1].isdigit():
+    if pinyin_syllable[-1:].isdigit():
         tone = pinyin_syllable[-1]
         base = pinyin_syllable[:-1]
     else:
         tone = '5'  # Neutral tone
         base = pinyin_syllable
 
-    # Find initial (longest matching prefix)
-    initial = ''
-    final = base
-
-    for init in INITIALS_SORTED:
-        if base.startswith(init):
-            initial = init
-            final = base[len(init):]
-            break
+    # Initial is the longest matching prefix ('zh' before 'z')
+    if base[:2] in _TWO_LETTER_INITIALS:
+        initial = base[:2]
+    elif base[:1] in _ONE_LETTER_INITIALS:
+        initial = base[:1]
+    else:
+        initial = ''
 
     return Syllable(
         full=pinyin_syllable,
         initial=initial,
-        final=final,
+        final=base[len(initial):],
         tone=tone
     )
 
 
+def _compare_components(expected: Syllable, actual: Syllable) -> Tuple[bool, bool, bool]:
+    """Return (initial_match, final_match, tone_match) without building feedback."""
+    return (
+        expected.initial == actual.initial,
+        expected.final == actual.final,
+        expected.tone == actual.tone
+    )
+
+
 def compare_syllables(expected: Syllable, actual: Syllable) -> Dict:
     """
     Compare two syllables and identify differences.
@@ -142,9 +166,7 @@ def compare_syllables(expected: Syllable, actual: Syllable) -> Dict:
             'feedback': ' Correct'
         }
 
-    initial_match = expected.initial == actual.initial
-    final_match = expected.final == actual.final
-    tone_match = expected.tone == actual.tone
+    initial_match, final_match, tone_match = _compare_components(expected, actual)
 
     # Generate specific feedback
     errors = []
@@ -169,6 +191,17 @@ def compare_syllables(expected: Syllable, actual: Syllable) -> Dict:
     }
 
 
+def _format_feedback_summary(tone_errors: int, initial_errors: int, final_errors: int) -> str:
+    """Build the feedback summary from per-component error counts."""
+    if not (tone_errors or initial_errors or final_errors):
+        return " Perfect pronunciation!"
+
+    counts = (tone_errors, initial_errors, final_errors)
+    return "Issues: " + ", ".join(
+        f"{count} {label}" for count, label in zip(counts, FEEDBACK_ERROR_LABELS) if count > 0
+    )
+
+
 def generate_feedback_summary(comparisons: List[Dict]) -> str:
     """
     Generate human-readable feedback summary from syllable comparisons.
@@ -192,21 +225,13 @@ def generate_feedback_summary(comparisons: List[Dict]) -> str:
         'Issues: 1 tone error(s)'
     """
     if all(c['match'] for c in comparisons):
-        return " Perfect pronunciation!"
+        return _format_feedback_summary(0, 0, 0)
 
-    tone_errors = sum(1 for c in comparisons if not c['tone_match'])
-    initial_errors = sum(1 for c in comparisons if not c['initial_match'])
-    final_errors = sum(1 for c in comparisons if not c['final_match'])
-
-    feedback_parts = []
-    if tone_errors > 0:
-        feedback_parts.append(f"{tone_errors} tone error(s)")
-    if initial_errors > 0:
-        feedback_parts.append(f"{initial_errors} initial consonant error(s)")
-    if final_errors > 0:
-        feedback_parts.append(f"{final_errors} vowel/final error(s)")
-
-    return "Issues: " + ", ".join(feedback_parts)
+    return _format_feedback_summary(
+        tone_errors=sum(1 for c in comparisons if not c['tone_match']),
+        initial_errors=sum(1 for c in comparisons if not c['initial_match']),
+        final_errors=sum(1 for c in comparisons if not c['final_match'])
+    )
 
 
 def assess_pronunciation(expected_chinese: str, actual_chinese: str) -> Dict:
@@ -220,6 +245,9 @@ def assess_pronunciation(expected_chinese: str, actual_chinese: str) -> Dict:
     4. Calculates overall score
     5. Generates detailed feedback
 
+    Romanized input (no Chinese characters in actual_chinese) can't be
+    assessed and returns a zero score without pinyin conversion.
+
     Args:
         expected_chinese: What should have been said (Chinese characters)
         actual_chinese: What was actually said (from Whisper transcription)
@@ -256,6 +284,19 @@ def assess_pronunciation(expected_chinese: str, actual_chinese: str) -> Dict:
     """
     # Convert to pinyin
     expected_pinyin = text_to_pinyin(expected_chinese, Style.TONE3)
+
+    # Whisper sometimes returns romanization instead of characters; it has no
+    # tone marks to compare, so skip conversion and scoring entirely
+    if is_romanization(actual_chinese):
+        return {
+            'overall_match': False,
+            'score': 0.0,
+            'expected_pinyin': ' '.join(expected_pinyin),
+            'actual_pinyin': 'N/A (romanization)',
+            'syllable_details': [],
+            'summary': f'Whisper returned romanization: "{actual_chinese}" (cannot assess)'
+        }
+
     actual_pinyin = text_to_pinyin(actual_chinese, Style.TONE3)
 
     # Decompose into syllables
@@ -274,8 +315,10 @@ def assess_pronunciation(expected_chinese: str, actual_chinese: str) -> Dict:
                       f"got {len(actual_syllables)}"
         }
 
-    # Compare syllable by syllable
+    # Compare syllable by syllable, counting mismatches per component in the
+    # same pass so the score and summary don't need to rescan the details
     syllable_comparisons = []
+    initial_errors = final_errors = tone_errors = 0
     for i, (exp_syl, act_syl) in enumerate(zip(expected_syllables, actual_syllables)):
         comparison = compare_syllables(exp_syl, act_syl)
         comparison['position'] = i
@@ -283,16 +326,16 @@ def assess_pronunciation(expected_chinese: str, actual_chinese: str) -> Dict:
         comparison['actual'] = act_syl.full
         syllable_comparisons.append(comparison)
 
+        initial_errors += not comparison['initial_match']
+        final_errors += not comparison['final_match']
+        tone_errors += not comparison['tone_match']
+
     # Calculate overall score
     # Each syllable has 3 components: initial + final + tone
     total_components = len(expected_syllables) * 3
-    correct_components = sum([
-        comp['initial_match'] + comp['final_match'] + comp['tone_match']
-        for comp in syllable_comparisons
-    ])
-
+    correct_components = total_components - initial_errors - final_errors - tone_errors
     score = (correct_components / total_components) * 100 if total_components > 0 else 0
-    overall_match = all(comp['match'] for comp in syllable_comparisons)
+    overall_match = correct_components == total_components
 
     return {
         'overall_match': overall_match,
@@ -300,5 +343,5 @@ def assess_pronunciation(expected_chinese: str, actual_chinese: str) -> Dict:
         'expected_pinyin': ' '.join(expected_pinyin),
         'actual_pinyin': ' '.join(actual_pinyin),
         'syllable_details': syllable_comparisons,
-        'summary': generate_feedback_summary(syllable_comparisons)
+        'summary': _format_feedback_summary(tone_errors, initial_errors, final_errors)
     }
@@ -9,16 +9,33 @@ This module provides functions for:
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 from openai import OpenAI
-from pypinyin import pinyin, Style
+from pypinyin import lazy_pinyin, Style
 from opencc import OpenCC
 
 
+# CJK Unified Ideographs range
+_CJK_PATTERN = re.compile('[\u4e00-\u9fff]')
+
+# Common Chinese and English punctuation stripped by remove_punctuation
+# Chinese: 。，、；：？！《》〈〉【】〔〕（）
+# English: . , ; : ? ! " ' ( ) [ ] { }
+_PUNCTUATION = '。，、；：？！《》〈〉【】〔〕（）.,;:?!"\'()[]{}'
+_PUNCTUATION_PATTERN = re.compile('[' + re.escape(_PUNCTUATION) + r'\s]+')
+
+
+@lru_cache(maxsize=None)
 def get_openai_client() -> OpenAI:
     """
-    Get initialized OpenAI client.
+    Get the shared OpenAI client, creating it on first use.
+
+    Reusing one client keeps its HTTP connection pool alive across
+    transcriptions instead of re-establishing TLS for every request.
 
     Returns:
         OpenAI client instance
@@ -29,8 +46,17 @@ def get_openai_client() -> OpenAI:
     return OpenAI(api_key=api_key)
 
 
+def reset_openai_client() -> None:
+    """
+    Drop the shared OpenAI client so the next call creates a fresh one.
+
+    Useful after changing OPENAI_API_KEY in the same process.
+    """
+    get_openai_client.cache_clear()
+
+
 def transcribe_whisper(
-    audio_path: Path | str,
+    audio_path: Path | str | os.PathLike | BinaryIO,
     language: str = "zh",
     client: Optional[OpenAI] = None
 ) -> Dict:
@@ -38,7 +64,10 @@ def transcribe_whisper(
     Transcribe audio using OpenAI Whisper.
 
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file (any str or os.PathLike, such as an
+            os.DirEntry from os.scandir), or an open binary stream (e.g. an
+            io.BytesIO of recorded audio). Streams are uploaded as-is and
+            should have a `name` with the audio extension, e.g. 'clip.wav'
         language: Language code (zh for Mandarin)
         client: Optional pre-initialized OpenAI client
 
@@ -52,11 +81,16 @@ def transcribe_whisper(
     if client is None:
         client = get_openai_client()
 
-    audio_path = Path(audio_path)
-    if not audio_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    if isinstance(audio_path, (str, os.PathLike)):
+        audio_path = Path(audio_path)
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        audio_source = open(audio_path, "rb")
+    else:
+        # Caller owns the stream, so don't close it
+        audio_source = nullcontext(audio_path)
 
-    with open(audio_path, "rb") as audio_file:
+    with audio_source as audio_file:
         response = client.audio.transcriptions.create(
             model="whisper-1",
             file=audio_file,
@@ -85,6 +119,63 @@ def transcribe_whisper(
     }
 
 
+def transcribe_batch(
+    audio_paths: List[Path | str],
+    language: str = "zh",
+    max_workers: int = 8,
+    client: Optional[OpenAI] = None,
+    return_exceptions: bool = False
+) -> List[Dict | Exception]:
+    """
+    Transcribe several audio files concurrently using OpenAI Whisper.
+
+    Requests are network-bound, so they are issued from a thread pool sharing
+    a single client. Results are returned in the same order as audio_paths.
+
+    Args:
+        audio_paths: Paths to audio files
+        language: Language code (zh for Mandarin)
+        max_workers: Maximum number of concurrent requests (default: 8)
+        client: Optional pre-initialized OpenAI client
+        return_exceptions: Return a failed transcription's exception in its
+            slot instead of raising, so every successful (already billed)
+            result is kept (default: False)
+
+    Returns:
+        List of transcription dicts as returned by transcribe_whisper(), with
+        exceptions in place of failed transcriptions if return_exceptions is set
+
+    Raises:
+        The first exception in input order, unless return_exceptions is set.
+        Requests that haven't started by then are cancelled.
+
+    Examples:
+        >>> results = transcribe_batch(["data/eval_audio/eval_ni_hao_perfect_001.wav",
+        ...                             "data/eval_audio/eval_xie_xie_perfect_001.wav"])
+        >>> [r['text'] for r in results]
+        ['你好', '谢谢']
+    """
+    if client is None:
+        client = get_openai_client()
+
+    transcribe = partial(transcribe_whisper, language=language, client=client)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(transcribe, audio_path) for audio_path in audio_paths]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    # Don't start (and pay for) the remaining requests
+                    executor.shutdown(cancel_futures=True)
+                    raise
+                results.append(e)
+
+    return results
+
+
 def text_to_pinyin(text: str, style: Style = Style.TONE3) -> List[str]:
     """
     Convert Chinese text to pinyin.
@@ -102,9 +193,14 @@ def text_to_pinyin(text: str, style: Style = Style.TONE3) -> List[str]:
         >>> text_to_pinyin("妈妈")
         ['ma1', 'ma1']
     """
-    result = pinyin(text, style=style, heteronym=False)
-    # Flatten the nested list
-    return [syllable[0] for syllable in result]
+    return list(_text_to_pinyin_cached(text, style))
+
+
+@lru_cache(maxsize=4096)
+def _text_to_pinyin_cached(text: str, style: Style) -> tuple:
+    """Memoized pinyin conversion; returns an immutable tuple so cached values can't be mutated."""
+    # lazy_pinyin returns a flat list, so there are no one-element sublists to unpack
+    return tuple(lazy_pinyin(text, style=style))
 
 
 def text_to_pinyin_display(text: str) -> str:
@@ -121,15 +217,22 @@ def text_to_pinyin_display(text: str) -> str:
         >>> text_to_pinyin_display("你好")
         'nǐ hǎo'
     """
-    result = pinyin(text, style=Style.TONE)
-    return ' '.join([syllable[0] for syllable in result])
+    return ' '.join(lazy_pinyin(text, style=Style.TONE))
+
+
+@lru_cache(maxsize=None)
+def _get_t2s_converter() -> OpenCC:
+    """Create the shared traditional-to-simplified converter on first use."""
+    return OpenCC('t2s')  # t2s = traditional to simplified
 
 
+@lru_cache(maxsize=2048)
 def convert_traditional_to_simplified(text: str) -> str:
     """
     Convert traditional Chinese characters to simplified.
 
     Whisper sometimes returns traditional characters, so we normalize to simplified.
+    Results are memoized since the same transcript recurs across eval cases.
 
     Args:
         text: Chinese text (may contain traditional characters)
@@ -137,8 +240,7 @@ def convert_traditional_to_simplified(text: str) -> str:
     Returns:
         Text with all characters converted to simplified
     """
-    cc = OpenCC('t2s')  # t2s = traditional to simplified
-    return cc.convert(text)
+    return _get_t2s_converter().convert(text)
 
 
 def remove_punctuation(text: str) -> str:
@@ -161,13 +263,10 @@ def remove_punctuation(text: str) -> str:
         >>> remove_punctuation("你好，世界！")
         "你好世界"
     """
-    # Remove common Chinese and English punctuation
-    # Chinese: 。，、；：？！""''《》〈〉【】〔〕（）
-    # English: . , ; : ? ! " ' ( ) [ ] { }
-    punctuation_pattern = r'[。，、；：？！""''《》〈〉【】〔〕（）\.\,\;\:\?\!\"\'\(\)\[\]\{\}\s]+'
-    return re.sub(punctuation_pattern, '', text)
+    return _PUNCTUATION_PATTERN.sub('', text)
 
 
+@lru_cache(maxsize=2048)
 def is_romanization(text: str) -> bool:
     """
     Check if transcription result is romanized (not Chinese characters).
@@ -190,9 +289,9 @@ def is_romanization(text: str) -> bool:
         True
     """
     # If text contains any Chinese characters, it's not romanization
-    for char in text:
-        if '\u4e00' <= char <= '\u9fff':  # CJK Unified Ideographs range
-            return False
+    # (pure ASCII can't, so the regex scan is skipped for it)
+    if not text.isascii() and _CJK_PATTERN.search(text):
+        return False
 
     # If no Chinese characters found, likely romanization
     # (but could also be empty or punctuation only)
@@ -0,0 +1,64 @@
+"""Tests for audio file helpers."""
+
+import os
+import struct
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from src.audio_utils import _read_wav_duration, get_audio_durations, get_audio_files
+
+
+def _write_wav(path, seconds=1.0, samplerate=16000):
+    """Write a mono 16-bit WAV of the given length and return its path."""
+    sf.write(path, np.zeros(int(seconds * samplerate), dtype=np.int16), samplerate, subtype='PCM_16')
+    return path
+
+
+def _patch_data_size(path, size):
+    """Overwrite the size field of the 'data' chunk header."""
+    raw = bytearray(path.read_bytes())
+    offset = raw.index(b'data') + 4
+    raw[offset:offset + 4] = struct.pack('<I', size)
+    path.write_bytes(bytes(raw))
+
+
+def test_wav_duration_from_header(tmp_path):
+    path = _write_wav(tmp_path / 'clip.wav', seconds=1.5)
+    assert get_audio_durations([path]) == [pytest.approx(1.5)]
+
+
+def test_wav_duration_clamped_to_truncated_data(tmp_path):
+    path = _write_wav(tmp_path / 'clip.wav')
+    raw = path.read_bytes()
+    path.write_bytes(raw[:len(raw) // 2 + 1])
+    assert get_audio_durations([path]) == [pytest.approx(sf.info(path).duration)]
+
+
+@pytest.mark.parametrize('size', [0, 0xFFFFFFFF])
+def test_wav_placeholder_data_size_falls_back_to_soundfile(tmp_path, size):
+    path = _write_wav(tmp_path / 'clip.wav')
+    _patch_data_size(path, size)
+    duration, = get_audio_durations([path])
+    assert duration == pytest.approx(sf.info(path).duration)
+    assert duration < 2.0
+
+
+def test_wav_short_fmt_chunk_returns_none(tmp_path):
+    path = tmp_path / 'clip.wav'
+    fmt = struct.pack('<HHI', 1, 1, 16000)
+    data = b'\x00' * 3200
+    body = b'WAVE' + b'fmt ' + struct.pack('<I', len(fmt)) + fmt + b'data' + struct.pack('<I', len(data)) + data
+    path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+    assert _read_wav_duration(str(path)) is None
+
+
+def test_get_audio_files_matches_case_like_glob(tmp_path, monkeypatch):
+    for name in ('a.wav', 'b.WAV', 'c.Wav', 'd.mp3'):
+        (tmp_path / name).touch()
+    assert [p.name for p in get_audio_files(tmp_path)] == ['a.wav']
+
+    # Windows folds case in both Path.glob and normcase
+    monkeypatch.setattr(os.path, 'normcase', str.lower)
+    assert [p.name for p in get_audio_files(tmp_path)] == ['a.wav', 'b.WAV', 'c.Wav']
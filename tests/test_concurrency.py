@@ -0,0 +1,104 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src import concurrency
+from src.concurrency import AdaptiveConcurrencyLimiter
+
+
+class RateLimited(Exception):
+    pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the limiter's clock with one that only moves when told to."""
+    state = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(concurrency, 'time', SimpleNamespace(monotonic=lambda: state.now))
+    return state
+
+
+def _run_calls(limiter, clock, count, latency):
+    """Make `count` sequential calls that each take `latency` seconds."""
+    def work():
+        clock.now += latency
+
+    for _ in range(count):
+        limiter.call(work)
+
+
+def _rate_limited():
+    raise RateLimited()
+
+
+def test_limit_grows_on_stable_latency_up_to_maximum(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial=1, maximum=3)
+
+    _run_calls(limiter, clock, 1, latency=1.0)
+    assert limiter.limit == 2
+
+    _run_calls(limiter, clock, 50, latency=1.0)
+    assert limiter.limit == 3
+
+
+def test_limit_shrinks_on_slower_latency_down_to_minimum(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=4, minimum=2, latency_tolerance=0.2)
+    _run_calls(limiter, clock, 2, latency=1.0)
+    assert limiter.limit == 3
+
+    _run_calls(limiter, clock, 3, latency=1.5)
+    assert limiter.limit == 2
+
+    _run_calls(limiter, clock, 20, latency=1.5)
+    assert limiter.limit == 2
+
+
+def test_rate_limit_error_halves_limit_down_to_minimum(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=8, minimum=2, rate_limit_errors=(RateLimited,))
+
+    for expected in (4, 2, 2):
+        with pytest.raises(RateLimited):
+            limiter.call(_rate_limited)
+        assert limiter.limit == expected
+
+
+def test_other_errors_leave_limit_unchanged(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial=4, rate_limit_errors=(RateLimited,))
+
+    with pytest.raises(ValueError):
+        limiter.call(int, 'not a number')
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.parametrize('initial, maximum', [(3, 3), (2, 5)])
+def test_concurrent_calls_never_exceed_limit(initial, maximum):
+    limiter = AdaptiveConcurrencyLimiter(initial=initial, maximum=maximum)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.002)
+        with lock:
+            active -= 1
+
+    threads = [
+        threading.Thread(target=lambda: [limiter.call(work) for _ in range(10)])
+        for _ in range(12)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert limiter._in_flight == 0
+    assert initial <= peak <= maximum
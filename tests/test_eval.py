@@ -0,0 +1,64 @@
+"""Tests for the evaluation runner."""
+
+import json
+
+from src.eval import append_cache_entries, load_cache
+
+
+def test_load_cache_skips_lines_that_are_not_objects(tmp_path):
+    cache_file = tmp_path / "cache.jsonl"
+    cache_file.write_text(
+        '{"abc": {"text": "你好"}}\n'
+        '1\n'
+        '"x"\n'
+        '["def", {"text": "再见"}]\n'
+        '{"ghi": {"text": "谢谢"}}\n'
+        '{"truncat\n',
+        encoding="utf-8"
+    )
+
+    cache = load_cache(cache_file)
+
+    assert cache == {"abc": {"text": "你好"}, "ghi": {"text": "谢谢"}}
+
+
+def test_load_cache_compacts_after_skipping_bad_lines(tmp_path):
+    cache_file = tmp_path / "cache.jsonl"
+    cache_file.write_text('{"abc": {"text": "你好"}}\n1\n[]\nnull\n', encoding="utf-8")
+
+    load_cache(cache_file)
+
+    lines = cache_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"abc": {"text": "你好"}}]
+
+
+def test_load_cache_reads_and_preserves_legacy_json_cache(tmp_path):
+    cache_file = tmp_path / "cache.json"
+    legacy = {"abc": {"text": "你好"}, "def": {"text": "再见"}}
+    cache_file.write_text(json.dumps(legacy, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    assert load_cache(cache_file) == legacy
+
+    append_cache_entries({"ghi": {"text": "谢谢"}}, cache_file)
+    assert load_cache(cache_file) == {**legacy, "ghi": {"text": "谢谢"}}
+
+
+def test_load_cache_moves_aside_file_with_no_readable_entries(tmp_path):
+    cache_file = tmp_path / "cache.jsonl"
+    contents = '{"abc": {"text": \n1\n[]\n'
+    cache_file.write_text(contents, encoding="utf-8")
+
+    assert load_cache(cache_file) == {}
+
+    assert not cache_file.exists()
+    moved, = tmp_path.glob("cache.jsonl.*.unreadable")
+    assert moved.read_text(encoding="utf-8") == contents
+
+
+def test_append_cache_entries_after_truncated_line(tmp_path):
+    cache_file = tmp_path / "cache.jsonl"
+    cache_file.write_text('{"abc": {"text": "你好"}}\n{"def": {"te', encoding="utf-8")
+
+    append_cache_entries({"ghi": {"text": "谢谢"}}, cache_file)
+
+    assert load_cache(cache_file) == {"abc": {"text": "你好"}, "ghi": {"text": "谢谢"}}
@@ -0,0 +1,62 @@
+"""Tests for report generation."""
+
+import csv
+import re
+
+from src.report import CSV_COLUMNS, create_timestamped_filename, save_results_csv
+
+
+def _result(i):
+    """Build a full evaluation result with text that needs CSV quoting."""
+    return {
+        'filename': f'case_{i:05d}.wav',
+        'error_type': 'tone_error',
+        'severity': 'minor',
+        'score': i / 7,
+        'overall_match': i % 2 == 0,
+        'expected_chinese': '你好，"世界"',
+        'actual_chinese': '你好,\n世界',
+        'expected_pinyin': 'nǐ hǎo',
+        'actual_pinyin': 'ni3 hao3',
+        'summary': f'case {i}',
+        'is_romanization': False,
+        'processing_time': 0.5,
+        'cached': True,
+    }
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_save_results_csv_round_trips_large_batch(tmp_path):
+    results = [_result(i) for i in range(10_000)]
+
+    path = save_results_csv(results, tmp_path / 'results.csv')
+
+    rows = _read_csv(path)
+    assert list(rows[0]) == CSV_COLUMNS
+    assert rows == [{col: str(r[col]) for col in CSV_COLUMNS} for r in results]
+
+
+def test_save_results_csv_fills_missing_fields_for_failed_cases(tmp_path):
+    failed = {'filename': 'broken.wav', 'error': 'Transcription failed: boom', 'score': 0.0, 'overall_match': False}
+    results = [_result(i) for i in range(5_000)] + [failed] + [_result(i) for i in range(5_000, 10_000)]
+
+    rows = _read_csv(save_results_csv(results, tmp_path / 'results.csv'))
+
+    assert len(rows) == len(results)
+    assert rows[5_000] == {col: str(failed.get(col, '')) for col in CSV_COLUMNS}
+    assert rows[-1] == {col: str(results[-1][col]) for col in CSV_COLUMNS}
+
+
+def test_create_timestamped_filename_default_format():
+    assert re.fullmatch(r'eval_results_\d{8}_\d{6}\.csv', create_timestamped_filename('eval_results'))
+
+
+def test_create_timestamped_filename_unique_names_do_not_collide():
+    names = [create_timestamped_filename('eval_results', unique=True) for _ in range(5_000)]
+
+    assert len(set(names)) == len(names)
+    assert all(re.fullmatch(r'eval_results_\d{8}_\d{6}_\d{4,}\.csv', name) for name in names)
@@ -0,0 +1,91 @@
+"""Tests for transcription utilities."""
+
+import io
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from src.transcription import transcribe_batch, transcribe_whisper
+
+
+def _mock_client(fail_on=()):
+    """OpenAI client stub whose transcription raises for files named in fail_on."""
+    def create(file, **kwargs):
+        name = file.name.rsplit("/", 1)[-1]
+        if name in fail_on:
+            raise RuntimeError(f"API error for {name}")
+        return Mock(text=name, language="zh", duration=1.0, segments=None)
+
+    client = Mock()
+    client.audio.transcriptions.create.side_effect = create
+    return client
+
+
+@pytest.fixture
+def audio_files(tmp_path):
+    paths = []
+    for name in ("a.wav", "b.wav", "c.wav"):
+        path = tmp_path / name
+        path.write_bytes(b"fake audio")
+        paths.append(path)
+    return paths
+
+
+def test_transcribe_batch_returns_results_in_input_order(audio_files):
+    results = transcribe_batch(audio_files, client=_mock_client())
+
+    assert [r["text"] for r in results] == ["a.wav", "b.wav", "c.wav"]
+
+
+def test_transcribe_batch_raises_first_failure_by_default(audio_files):
+    with pytest.raises(RuntimeError, match="b.wav"):
+        transcribe_batch(audio_files, client=_mock_client(fail_on={"b.wav"}))
+
+
+def test_transcribe_batch_return_exceptions_keeps_successes(audio_files):
+    results = transcribe_batch(
+        audio_files, client=_mock_client(fail_on={"b.wav"}), return_exceptions=True
+    )
+
+    assert results[0]["text"] == "a.wav"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2]["text"] == "c.wav"
+
+
+class _PathLike:
+    """Minimal os.PathLike that is not a pathlib.Path."""
+
+    def __init__(self, path):
+        self._path = path
+
+    def __fspath__(self):
+        return os.fspath(self._path)
+
+
+def test_transcribe_whisper_opens_dir_entry(audio_files):
+    client = _mock_client()
+    entry = next(e for e in os.scandir(audio_files[0].parent) if e.name == "a.wav")
+
+    result = transcribe_whisper(entry, client=client)
+
+    assert result["text"] == "a.wav"
+    uploaded = client.audio.transcriptions.create.call_args.kwargs["file"]
+    assert uploaded.closed  # opened from the path and closed afterwards
+
+
+def test_transcribe_whisper_missing_pathlike_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        transcribe_whisper(_PathLike(tmp_path / "missing.wav"), client=_mock_client())
+
+
+def test_transcribe_whisper_uploads_stream_without_closing_it():
+    client = _mock_client()
+    stream = io.BytesIO(b"fake audio")
+    stream.name = "clip.wav"
+
+    result = transcribe_whisper(stream, client=client)
+
+    assert result["text"] == "clip.wav"
+    assert client.audio.transcriptions.create.call_args.kwargs["file"] is stream
+    assert not stream.closed